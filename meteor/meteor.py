@@ -1,23 +1,36 @@
+import re
 from abc import ABC
 from abc import abstractmethod
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
-from itertools import groupby
-from itertools import product
-from operator import itemgetter
+from functools import lru_cache
+from itertools import combinations
+from itertools import count
+from sys import intern
 from typing import Any
+from typing import DefaultDict
+from typing import Dict
+from typing import FrozenSet
 from typing import Iterable
 from typing import List
+from typing import Set
 from typing import Tuple
 
-from mip import BINARY
-from mip import Model
-from mip import OptimizationStatus
-from mip import maximize
-from mip import xsum
-from nltk import SnowballStemmer
-from nltk import word_tokenize
+import numpy as np
+
+# weight assigned to token pairs that do not match under any stage;
+# large enough (in absolute terms) that the assignment solver always
+# prefers real matches over non-matches
+NO_MATCH = -1e9
+
+# match weight one crossing costs in the alignment objective; the BILP
+# formulation this replaces penalized every crossing once per ordered
+# pair of matches, i.e. twice
+CROSSING_PENALTY = 2.0
 
 
 class Language(str, Enum):
@@ -25,13 +38,29 @@ class Language(str, Enum):
     english = "english"
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     tid: int
     text: str
     stages: List[Any] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class Sentence:
+    """
+    Struct-of-arrays view of a preprocessed sentence: the token texts
+    plus one list of interned stage ids per stage, indexed as
+    stages[stage_index][token_index]. Keeping each stage's ids
+    contiguous makes the alignment comparisons cache-friendly.
+    """
+
+    texts: List[str]
+    stages: List[List[int]]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
 class StageBase(ABC):
     """
     Base class for matching stages. Matching stages produce representations
@@ -41,11 +70,26 @@ class StageBase(ABC):
 
     def __init__(self, weight: float, *args, **kwargs):
         self._weight = weight
+        # maps every distinct stage representation to a small integer
+        # so that matching compares ints instead of strings; shared
+        # across sentences to keep the ids consistent
+        self._intern: DefaultDict[Any, int] = defaultdict(count().__next__)
 
     @property
     def weight(self) -> float:
         return self._weight
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the interning table holds an unpicklable counter; ids are
+        # only meaningful within a single process anyway
+        state["_intern"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._intern = defaultdict(count().__next__)
+
     @abstractmethod
     def process_tokens(self, tokens: List[Token]):
         """
@@ -67,155 +111,432 @@ class IdentityStage(StageBase):
             token.stages.append(token.text)
 
 
+# stems are deterministic per (language, surface form), so one cache
+# per language is shared by all stage instances in the process
+_STEM_CACHE: DefaultDict[str, Dict[str, str]] = defaultdict(dict)
+
+
+@lru_cache(maxsize=None)
+def _get_stemmer(language: str):
+    """
+    Shared per-language stemmer instance; the stemmer is read-only
+    after construction, so all stages can safely use the same one.
+    """
+    # imported lazily to keep module import (and CLI startup) fast
+    import snowballstemmer
+
+    return snowballstemmer.stemmer(language)
+
+
+@lru_cache(maxsize=None)
+def _get_stopwords(language: str) -> FrozenSet[str]:
+    """
+    Stopwords that the stemming stage leaves unstemmed, matching
+    nltk's SnowballStemmer(ignore_stopwords=True) behaviour.
+    """
+    # imported lazily, like the tokenizer, to keep module import fast
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words(language))
+
+
 class StemmingStage(StageBase):
     """ Use stemming to find tokens with the same stem """
 
     def __init__(self, weight: float, language: Language, *args, **kwargs):
         super().__init__(weight, *args, **kwargs)
-        self._stemmer = SnowballStemmer(
-            language=language.value, ignore_stopwords=True
-        )
+        self._language = language
+        self._init_stemmer()
+
+    def _init_stemmer(self):
+        self._stemmer = _get_stemmer(self._language.value)
+        self._stopwords = _get_stopwords(self._language.value)
+        self._cache = _STEM_CACHE[self._language.value]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # stemmer, stopwords and cache are rebuilt from the language
+        # on unpickle
+        del state["_stemmer"]
+        del state["_stopwords"]
+        del state["_cache"]
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._init_stemmer()
 
     def process_tokens(self, tokens: List[Token]):
+        # stem all uncached surface forms of the sentence in one batch
+        # call, which amortizes the stemmer dispatch overhead; input is
+        # lowercased because snowballstemmer, unlike nltk's wrapper,
+        # does not do so itself and matching should stay
+        # case-insensitive
+        cache = self._cache
+        misses = list(
+            dict.fromkeys(t.text for t in tokens if t.text not in cache)
+        )
+        if misses:
+            # stopwords stay unstemmed, as with nltk's
+            # SnowballStemmer(ignore_stopwords=True)
+            lowered = [text.lower() for text in misses]
+            stems = self._stemmer.stemWords(lowered)
+            cache.update(
+                (text, low if low in self._stopwords else stem)
+                for text, low, stem in zip(misses, lowered, stems)
+            )
         for token in tokens:
-            token.stages.append(self._stemmer.stem(token.text))
+            token.stages.append(cache[token.text])
+
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
 
 
 def tokenize(text: str, language: Language) -> List[Token]:
+    # imported lazily so that merely importing this module (e.g. for
+    # the command line help) does not pay for nltk's startup
+    from nltk import word_tokenize
+
+    # interned token texts make the dict lookups in the stem cache and
+    # the stage interning tables pointer comparisons
     return [
-        Token(tid=i, text=token)
+        Token(tid=i, text=intern(token))
         for i, token in enumerate(word_tokenize(text, language=language.value))
     ]
 
 
+def tokenize_fast(text: str, language: Language) -> List[Token]:
+    """
+    Tokenize with a single precompiled regex instead of nltk's
+    word_tokenize. Close to word_tokenize's output for most languages
+    but skips the Punkt machinery entirely; the language argument is
+    unused and only kept for signature parity with tokenize.
+    """
+    return [
+        Token(tid=i, text=intern(token))
+        for i, token in enumerate(_TOKEN_RE.findall(text))
+    ]
+
+
 def preprocess(
-    stages: List[StageBase], text: str, language: Language
-) -> List[Token]:
+    stages: List[StageBase],
+    text: str,
+    language: Language,
+    fast_tokenize: bool = False,
+) -> Sentence:
     """
-    Tokenize the given text and apply all given matching stages to each token.
+    Tokenize the given text, apply all given matching stages to each
+    token and repack the result into a Sentence.
     """
-    tokens = tokenize(text, language)
+    tokens = (tokenize_fast if fast_tokenize else tokenize)(text, language)
     for stage in stages:
-        stage.process_tokens(tokens)
-        stage.validate(tokens)
-    return tokens
+        if type(stage) is IdentityStage:
+            # the identity representation is just the text itself, so
+            # skip the method dispatch and the validation pass
+            for token in tokens:
+                token.stages.append(token.text)
+        else:
+            stage.process_tokens(tokens)
+            stage.validate(tokens)
+        # replace the stage representations with interned integer ids
+        # so that align only ever compares ints
+        intern_table = stage._intern
+        for token in tokens:
+            token.stages[-1] = intern_table[token.stages[-1]]
+    return Sentence(
+        texts=[token.text for token in tokens],
+        stages=[
+            [token.stages[i] for token in tokens]
+            for i in range(len(stages))
+        ],
+    )
 
 
 def align(
-    hypothesis: List[Token], reference: List[Token], stages: List[StageBase]
+    hypothesis: Sentence, reference: Sentence, stages: List[StageBase]
 ) -> List[Tuple[int, int]]:
     """
     Produce an alignment between matching tokens of each sentence.
-    If there are multiple possible alignments, the one with the minimum
-    number of crossings between matches is chosen. Matches are weighted
-    by their stage weight.
-
-    Uses the following binary integer linear program to find the optimal
-    alignment:
-
-    variables:
-        M(i,j): set of possible matches, defined by the different stages
-        C = M(i,j) x M(k,l): set of possible crossings of matches,
-                             for each i < k and j > l OR i > k and j < l
-        W: weights for each stage
-
-    constraints:
-        each token is matched with not more than one other token
-            m(i,0) + ... + m(i, j) <= 1
-            m(0,j) + ... + m(i, j) <= 1
-        there must be as many matches as there possible matches between
-        connected nodes in the alignment graph
-            m(0,0) ... m(i,j) == sum(possible matches per clique)
-        if two matches cross each other, the corresponding crossing var is 1
-            m(i,j) + m(k,l) - c(i,j,k,l) <= 1
-
-    objective function:
-        maximize match scores, minimize crossings
-        MAX (SUM w(i,j) * m(i,j) - SUM c(i,j,k,l))
-
-    """
-
-    # compute all possible matches with their best weight over all stages
-    match_weights = [
-        [float("-inf")] * len(reference) for _ in range(len(hypothesis))
-    ]
-    for hyptoken, reftoken in product(hypothesis, reference):
-        weights = [
-            stage.weight
-            for i, stage in enumerate(stages)
-            if hyptoken.stages[i] == reftoken.stages[i]
-        ]
-        if weights:
-            match_weights[hyptoken.tid][reftoken.tid] = max(weights)
-
-    # create BILP
-    model = Model("alignment")
-    model.verbose = 0  # set to n > 0 to see solver output
-
-    # create matching variables for each possible match
-    match_vars = {
-        (h, r): model.add_var(var_type=BINARY)
-        for h in range(len(hypothesis))
-        for r in range(len(reference))
-        if match_weights[h][r] > float("-inf")
-    }
-
-    # create crossing variables for each possible crossing of any two matches
-    # add constraint that crossing var will be 1 if both matches are selected
-    crossing_vars = []
-    for (i, j), (k, l) in product(match_vars.keys(), repeat=2):
-        if (i < k and j > l) or (i > k and j < l):
-            cvar = model.add_var(var_type=BINARY)
-            model += (
-                xsum([-1.0 * cvar, match_vars[(i, j)], match_vars[(k, l)]])
-                <= 1
+    Every token that can be matched is matched; among the alignments
+    of that size, the one maximizing the total match weight minus
+    CROSSING_PENALTY per crossing between matches is chosen, like the
+    BILP formulation this replaces. Matches are weighted by their
+    stage weight.
+
+    The match-uniqueness requirement makes this a weighted bipartite
+    assignment problem, which is solved with the Hungarian algorithm
+    (scipy's linear_sum_assignment) on the matrix of match weights.
+    Crossings are resolved afterwards: a local search swaps or moves
+    selected matches while that improves the objective, and if any
+    crossings are left once it converges, an exact branch and bound
+    over all candidate matches settles the optimum. Only on
+    pathologically repetitive sentences can the exact search exhaust
+    its node budget and fall back to the best alignment found.
+    """
+
+    # imported lazily to keep module import (and CLI startup) fast
+    from scipy.optimize import linear_sum_assignment
+
+    if len(hypothesis) == 0 or len(reference) == 0:
+        return []
+
+    # collect all possible matches per stage through an inverted index
+    # over the reference ids, so only the (h, r) pairs that actually
+    # match are ever touched instead of the full grid
+    cand_h: List[int] = []
+    cand_r: List[int] = []
+    cand_stage: List[int] = []
+    for i, stage in enumerate(stages):
+        index: DefaultDict[int, List[int]] = defaultdict(list)
+        for r, ref_id in enumerate(reference.stages[i]):
+            index[ref_id].append(r)
+        for h, hyp_id in enumerate(hypothesis.stages[i]):
+            if hyp_id in index:
+                for r in index[hyp_id]:
+                    cand_h.append(h)
+                    cand_r.append(r)
+                    cand_stage.append(i)
+
+    if not cand_h:
+        return []
+
+    # scatter the per-stage weights into the matrix in one vector op,
+    # keeping the best weight wherever several stages match
+    stage_weights = np.asarray([stage.weight for stage in stages])
+    match_weights = np.full((len(hypothesis), len(reference)), NO_MATCH)
+    np.maximum.at(match_weights, (cand_h, cand_r), stage_weights[cand_stage])
+    weights = match_weights.tolist()
+
+    # with a single token on either side no crossings are possible and
+    # the alignment is simply the highest-weighted candidate, if any
+    if min(len(hypothesis), len(reference)) == 1:
+        best_h, best_r = np.unravel_index(
+            np.argmax(match_weights), match_weights.shape
+        )
+        if match_weights[best_h][best_r] > NO_MATCH:
+            return [(int(best_h), int(best_r))]
+        return []
+
+    candidates = sorted(set(zip(cand_h, cand_r)))
+
+    # solve a maximum-weight assignment independently per connected
+    # component of the match graph; components are much smaller than
+    # the full matrix and the Hungarian algorithm is cubic, so this
+    # pays off quickly. The NO_MATCH sentinel ensures that real
+    # matches always take precedence over non-matches.
+    selected: List[Tuple[int, int]] = []
+    for clique in compute_cliques(candidates):
+        hyp_pos = sorted(set(h for h, _ in clique))
+        ref_pos = sorted(set(r for _, r in clique))
+        sub_weights = match_weights[np.ix_(hyp_pos, ref_pos)]
+        row_ind, col_ind = linear_sum_assignment(sub_weights, maximize=True)
+        selected.extend(
+            (hyp_pos[a], ref_pos[b])
+            for a, b in zip(row_ind, col_ind)
+            if sub_weights[a][b] > NO_MATCH
+        )
+    selected.sort()
+
+    # resolve crossings after the assignment with a local search over
+    # the alignment objective: swap the endpoints of two crossing
+    # matches, or move one endpoint of a match to an unmatched
+    # position, whenever that improves the objective — possibly
+    # trading match weight for the crossings it removes. Both steps
+    # keep the number of matches, and with it the cardinality
+    # constraint, intact. Plain nested lists beat numpy scalar
+    # indexing here.
+    # The reference positions of a crossing-free alignment form an
+    # increasing sequence, so the longest increasing subsequence tells
+    # in O(k log k) whether any crossings are left to resolve at all.
+    while _lis_length([r for _, r in selected]) < len(selected):
+        changed = False
+        for a, b in combinations(range(len(selected)), 2):
+            i, j = selected[a]
+            k, l = selected[b]
+            if (
+                j < l
+                or weights[i][l] <= NO_MATCH
+                or weights[k][j] <= NO_MATCH
+            ):
+                continue
+            # crossing delta starts at one for the crossing between
+            # the two matches themselves, which the swap removes
+            removed = 1
+            for c, other in enumerate(selected):
+                if c == a or c == b:
+                    continue
+                removed += _crossing((i, j), other) + _crossing((k, l), other)
+                removed -= _crossing((i, l), other) + _crossing((k, j), other)
+            delta = (
+                weights[i][l]
+                + weights[k][j]
+                - weights[i][j]
+                - weights[k][l]
+                + CROSSING_PENALTY * removed
             )
-            crossing_vars.append(cvar)
-
-    # add uniqueness constraints: each word is matched to one other word
-    # words that can't be matched are already excluded
-    for h in range(len(hypothesis)):
-        matches = [
-            match_vars[(h, r)]
-            for r in range(len(reference))
-            if match_weights[h][r] > float("-inf")
-        ]
-        if matches:
-            model += xsum(matches) <= 1
-
-    for r in range(len(reference)):
-        matches = [
-            match_vars[(h, r)]
-            for h in range(len(hypothesis))
-            if match_weights[h][r] > float("-inf")
-        ]
-        if matches:
-            model += xsum(matches) <= 1
-
-    # require all possible matches to be part of the solution
-    cliques = compute_cliques(match_vars.keys())
-    required_matches = sum(
-        [
-            min(len(set(h for h, _ in clique)), len(set(r for _, r in clique)))
-            for clique in cliques
-        ]
+            if delta > 1e-9:
+                selected[a], selected[b] = (i, l), (k, j)
+                changed = True
+        for a in range(len(selected)):
+            others = selected[:a] + selected[a + 1 :]
+            used_h = {h for h, _ in others}
+            used_r = {r for _, r in others}
+            i, j = selected[a]
+            moves = [
+                (p, j)
+                for p in range(len(hypothesis))
+                if p not in used_h and weights[p][j] > NO_MATCH
+            ] + [
+                (i, q)
+                for q in range(len(reference))
+                if q not in used_r and weights[i][q] > NO_MATCH
+            ]
+            best = max(
+                moves, key=lambda move: _match_value(move, others, weights)
+            )
+            if (
+                _match_value(best, others, weights)
+                > _match_value((i, j), others, weights) + 1e-9
+            ):
+                selected[a] = best
+                changed = True
+        if not changed:
+            break
+        selected.sort()
+
+    # the local search converged with crossings left over; whether
+    # they are worth their weight can only be settled exactly, with
+    # the local-search solution as a strong lower bound for pruning
+    if _lis_length([r for _, r in selected]) < len(selected):
+        selected = _optimal_matches(candidates, weights, selected)
+
+    return selected
+
+
+def _optimal_matches(
+    candidates: List[Tuple[int, int]],
+    weights: List[List[float]],
+    initial: List[Tuple[int, int]],
+    budget: int = 100_000,
+) -> List[Tuple[int, int]]:
+    """
+    Exact search for the set of matches maximizing the total match
+    weight minus CROSSING_PENALTY per crossing, among the alignments
+    that match as many tokens as possible.
+
+    Depth-first branch and bound over the hypothesis positions in
+    order: every position either takes one of its candidate reference
+    positions or stays unmatched. The objective value of the initial
+    (local-search) solution prunes most of the tree; the node budget
+    caps the worst case on heavily repetitive sentences, where the
+    best solution found so far is returned. Ties keep the initial
+    solution, so the result is deterministic.
+    """
+    options: DefaultDict[int, List[Tuple[float, int]]] = defaultdict(list)
+    for h, r in candidates:
+        options[h].append((weights[h][r], r))
+    rows = sorted(options)
+
+    # the cardinality constraint of the BILP formulation: every clique
+    # contributes as many matches as it possibly can
+    required = sum(
+        min(len(set(h for h, _ in clique)), len(set(r for _, r in clique)))
+        for clique in compute_cliques(candidates)
     )
-    model += xsum(match_vars.values()) == required_matches
 
-    # define objective: maximize match scores and minimize crossings
-    model.objective = maximize(
-        xsum(
-            [match_weights[h][r] * match_vars[(h, r)] for h, r in match_vars]
-            + [-1.0 * cvar for cvar in crossing_vars]
+    # optimistic value of completing a partial solution from each row
+    # on, ignoring crossings and reference uniqueness
+    optimistic = [0.0] * (len(rows) + 1)
+    for idx in range(len(rows) - 1, -1, -1):
+        optimistic[idx] = optimistic[idx + 1] + max(
+            weight for weight, _ in options[rows[idx]]
         )
+
+    best = list(initial)
+    best_value = sum(
+        weights[h][r] for h, r in initial
+    ) - CROSSING_PENALTY * sum(
+        _crossing(a, b) for a, b in combinations(initial, 2)
     )
+    nodes_left = budget
+
+    chosen: List[Tuple[int, int]] = []
+    used: Set[int] = set()
+
+    def search(idx: int, value: float):
+        nonlocal best, best_value, nodes_left
+        if (
+            nodes_left <= 0
+            or value + optimistic[idx] <= best_value + 1e-9
+            or len(chosen) + len(rows) - idx < required
+        ):
+            return
+        nodes_left -= 1
+        if idx == len(rows):
+            best_value = value
+            best = sorted(chosen)
+            return
+        h = rows[idx]
+        # rows are visited in hypothesis order, so a new match crosses
+        # exactly the already chosen matches with a later reference
+        branches = sorted(
+            (
+                weight
+                - CROSSING_PENALTY
+                * sum(1 for _, prev in chosen if prev > r),
+                r,
+            )
+            for weight, r in options[h]
+            if r not in used
+        )
+        while branches:
+            gain, r = branches.pop()
+            used.add(r)
+            chosen.append((h, r))
+            search(idx + 1, value + gain)
+            chosen.pop()
+            used.remove(r)
+        search(idx + 1, value)
 
-    status = model.optimize()
-    assert (
-        status != OptimizationStatus.INFEASIBLE
-    ), "The alignment problem was infeasible. Please open an issue on github."
+    search(0, 0.0)
+    return best
 
-    return [match for match, var in match_vars.items() if var.x >= 0.99]
+
+def _crossing(match: Tuple[int, int], other: Tuple[int, int]) -> int:
+    """
+    1 if the two matches cross each other, else 0.
+    """
+    (h, r), (s, t) = match, other
+    return int((h < s and r > t) or (h > s and r < t))
+
+
+def _match_value(
+    match: Tuple[int, int],
+    others: List[Tuple[int, int]],
+    weights: List[List[float]],
+) -> float:
+    """
+    Contribution of a match to the alignment objective: its weight
+    minus the penalty for the crossings it is involved in.
+    """
+    h, r = match
+    return weights[h][r] - CROSSING_PENALTY * sum(
+        _crossing(match, other) for other in others
+    )
+
+
+def _lis_length(sequence: List[int]) -> int:
+    """
+    Length of the longest strictly increasing subsequence.
+    """
+    tails: List[int] = []
+    for value in sequence:
+        pos = bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+        else:
+            tails[pos] = value
+    return len(tails)
 
 
 def compute_cliques(
@@ -225,38 +546,68 @@ def compute_cliques(
     Group matches that are connected in the alignment graph into cliques
     """
     matches = list(matches)
-
-    # Simple union-find: group matches that connect the same node in the
-    # hypothesis or reference sentence.
-    sets = {index: index for index in range(len(matches))}
-    for i, (h_i, r_i) in enumerate(matches):
-        for j, (h_j, r_j) in enumerate(matches[i:]):
-            if h_i == h_j or r_i == r_j:
-                sets[i + j] = sets[i]
-
-    cliques = [
-        [matches[index] for index, _ in group]
-        for _, group in groupby(
-            sorted(sets.items(), key=itemgetter(1)), key=itemgetter(1)
-        )
-    ]
-    return cliques
+    if not matches:
+        return []
+
+    # map hypothesis and reference positions to one dense integer id
+    # space so the union-find runs on flat lists of ints instead of
+    # hashing tuple keys
+    h_ids: Dict[int, int] = {}
+    r_ids: Dict[int, int] = {}
+    for h, r in matches:
+        h_ids.setdefault(h, len(h_ids))
+        r_ids.setdefault(r, len(r_ids))
+    offset = len(h_ids)
+
+    # union-find with union by rank and path compression: matches
+    # sharing a hypothesis or reference position end up in the same set
+    parent = list(range(offset + len(r_ids)))
+    rank = [0] * len(parent)
+
+    def find(node: int) -> int:
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def union(a: int, b: int):
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b:
+            return
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+
+    for h, r in matches:
+        union(h_ids[h], offset + r_ids[r])
+
+    cliques: DefaultDict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for match in matches:
+        cliques[find(h_ids[match[0]])].append(match)
+    return list(cliques.values())
 
 
 def count_chunks(alignment: List[Tuple[int, int]]) -> int:
     """
     Find the minimum number of chunks the alignment can be grouped into.
     """
-    alignment = sorted(alignment)
+    if len(alignment) == 0:
+        return 0
 
-    num_chunks = 0
-    last_h, last_r = -2, -2
-    for (h, r) in alignment:
-        if abs(last_h - h) != 1 or abs(last_r - r) != 1:
-            num_chunks += 1
-        last_h, last_r = (h, r)
+    # work on one flat int32 buffer throughout; lexsort stays inside
+    # numpy instead of sorting a list of tuples
+    pairs = np.asarray(alignment, dtype=np.int32)
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
 
-    return num_chunks
+    # a new chunk starts wherever two neighbouring matches are not
+    # adjacent in both sentences
+    gap_h = np.abs(np.diff(pairs[:, 0])) != 1
+    gap_r = np.abs(np.diff(pairs[:, 1])) != 1
+    return int(1 + np.sum(gap_h | gap_r))
 
 
 def meteor(
@@ -264,14 +615,34 @@ def meteor(
     reference: str,
     stages: List[StageBase],
     language: Language,
+    fast_tokenize: bool = False,
 ) -> float:
     """
     Compute meteor score for the given sentence pair
     with the given set of matching stages.
+    Set fast_tokenize to trade nltk's tokenizer for a cheaper
+    regex-based one.
     """
 
-    hypo_tokens = preprocess(stages, hypothesis, language)
-    ref_tokens = preprocess(stages, reference, language)
+    # identical sentences always score a perfect match: precision and
+    # recall are 1 and a single chunk means no penalty
+    if hypothesis.split() == reference.split():
+        return 1.0
+
+    hypo_tokens = preprocess(stages, hypothesis, language, fast_tokenize)
+    ref_tokens = preprocess(stages, reference, language, fast_tokenize)
+
+    return score_alignment(hypo_tokens, ref_tokens, stages)
+
+
+def score_alignment(
+    hypo_tokens: Sentence,
+    ref_tokens: Sentence,
+    stages: List[StageBase],
+) -> float:
+    """
+    Compute the meteor score for an already preprocessed sentence pair.
+    """
 
     if len(hypo_tokens) == 0 or len(ref_tokens) == 0:
         if len(hypo_tokens) != len(ref_tokens):
@@ -304,9 +675,68 @@ def meteor_macro_avg(
     """
     Apply meteor score to multiple hypothesis-reference pairs
     and return the macro average.
+    Sentences that occur more than once are only preprocessed once,
+    in the parallel case once per worker chunk.
+    Large corpora are scored in parallel across processes.
+    """
+
+    # below this size the cost of spawning workers and pickling
+    # arguments outweighs the parallel speedup
+    if len(hypotheses) >= 32:
+        # workers score whole chunks of pairs, so each chunk shares
+        # one preprocess memo
+        chunks = [
+            (
+                hypotheses[start : start + 16],
+                references[start : start + 16],
+                stages,
+                language,
+            )
+            for start in range(0, len(hypotheses), 16)
+        ]
+        with ProcessPoolExecutor() as executor:
+            scores = [
+                score
+                for chunk_scores in executor.map(_meteor_chunk, chunks)
+                for score in chunk_scores
+            ]
+        return float(np.mean(scores))
+
+    return float(
+        np.mean(_score_pairs(hypotheses, references, stages, language))
+    )
+
+
+def _score_pairs(
+    hypotheses: List[str],
+    references: List[str],
+    stages: List[StageBase],
+    language: Language,
+) -> List[float]:
     """
-    scores = [
-        meteor(hypothesis, reference, stages, language)
+    Score the pairs serially, preprocessing every distinct sentence
+    only once.
+    """
+
+    @lru_cache(maxsize=None)
+    def cached_preprocess(text: str) -> Sentence:
+        return preprocess(stages, text, language)
+
+    return [
+        score_alignment(
+            cached_preprocess(hypothesis),
+            cached_preprocess(reference),
+            stages,
+        )
         for hypothesis, reference in zip(hypotheses, references)
     ]
-    return sum(scores) / len(scores)
+
+
+def _meteor_chunk(
+    args: Tuple[List[str], List[str], List[StageBase], Language]
+) -> List[float]:
+    """
+    Unpacking helper for scoring one chunk of sentence pairs in a
+    worker process.
+    """
+    return _score_pairs(*args)
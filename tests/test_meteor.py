@@ -128,6 +128,8 @@ def test_stage_validation():
             0.91,
         ),
         ("Frau Frauen", "Frau Frau", 1.0),
+        # stopwords are not stemmed, so "eine" does not match "einen"
+        ("eine Frau", "einen Frau", 0.5),
         ("Haus", "Kind", 0.0),
         ("", "Haus Kind", 0.0),
         ("", "", 1.0),
@@ -138,6 +140,29 @@ def test_meteor(stages, hypothesis, reference, expected_score):
     assert round(score, 2) == expected_score
 
 
+@pytest.mark.parametrize(
+    "hypothesis, reference, expected_score",
+    [
+        (
+            "Die Katze sitzt auf dem Dach.",
+            "Auf dem Dach sitzt die Katze.",
+            0.91,
+        ),
+        ("Frau Frauen", "Frau Frau", 1.0),
+        ("Haus", "Kind", 0.0),
+    ],
+)
+def test_meteor_fast_tokenize(stages, hypothesis, reference, expected_score):
+    score = meteor(
+        hypothesis,
+        reference,
+        stages,
+        Language.german,
+        fast_tokenize=True,
+    )
+    assert round(score, 2) == expected_score
+
+
 def test_english():
     stages = [IdentityStage(1.0), StemmingStage(0.6, Language.english)]
     score = meteor("action", "actionable", stages, Language.english)
@@ -158,3 +183,17 @@ def test_meteor_macro_avg(stages):
         meteor_macro_avg(hypotheses, references, stages, Language.german)
         == 0.75
     )
+
+
+def test_meteor_macro_avg_parallel(stages):
+    # enough pairs to cross the process-pool threshold, so the stages
+    # are pickled into the worker processes
+    hypotheses = ["Die Katze sitzt auf dem Dach"] * 40
+    references = ["Die Katze sitzt auf dem Dach"] * 20 + [
+        "Die Katze sitzt in der Badewanne"
+    ] * 20
+
+    assert (
+        meteor_macro_avg(hypotheses, references, stages, Language.german)
+        == 0.75
+    )